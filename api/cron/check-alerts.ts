@@ -2,6 +2,8 @@ import type { VercelRequest, VercelResponse } from '@vercel/node'
 import { kv } from '@vercel/kv'
 
 const DEFAULT_SCORE_THRESHOLD = 70
+const KV_MGET_BATCH_SIZE = 100
+const EXPO_PUSH_BATCH_SIZE = 100
 
 const BACKEND_URL =
   process.env.BACKEND_URL ?? 'https://time-to-sell-web-ios.onrender.com'
@@ -29,13 +31,7 @@ interface ExpoPushMessage {
   body: string
 }
 
-// Cache of fetched scores per index_type to avoid duplicate API calls
-const scoreCache = new Map<string, number | null>()
-
-async function getScore(indexType: string): Promise<number | null> {
-  if (scoreCache.has(indexType)) {
-    return scoreCache.get(indexType) ?? null
-  }
+async function fetchScore(indexType: string): Promise<number | null> {
   try {
     const res = await fetch(`${BACKEND_URL}/api/evaluate`, {
       method: 'POST',
@@ -47,39 +43,72 @@ async function getScore(indexType: string): Promise<number | null> {
         score_ma: 20,
       }),
     })
-    if (!res.ok) {
-      scoreCache.set(indexType, null)
-      return null
-    }
+    if (!res.ok) return null
     const data = (await res.json()) as EvaluateResponse
     const total = data?.scores?.total
-    const score = typeof total === 'number' ? total : null
-    scoreCache.set(indexType, score)
-    return score
+    return typeof total === 'number' ? total : null
   } catch {
-    scoreCache.set(indexType, null)
     return null
   }
 }
 
+// Scores are cached per cron run: a warm serverless instance must not reuse
+// scores (or failed lookups) from a previous run. The in-flight promise is
+// cached so concurrent callers for the same index_type share a single request.
+function createScoreLookup(): (indexType: string) => Promise<number | null> {
+  const scoreCache = new Map<string, Promise<number | null>>()
+  return (indexType) => {
+    let pending = scoreCache.get(indexType)
+    if (!pending) {
+      pending = fetchScore(indexType)
+      scoreCache.set(indexType, pending)
+    }
+    return pending
+  }
+}
+
+// Expo's push API accepts at most 100 messages per request
 async function sendExpoPushNotifications(
   messages: ExpoPushMessage[]
 ): Promise<void> {
-  const res = await fetch('https://exp.host/--/api/v2/push/send', {
-    method: 'POST',
-    headers: {
-      Accept: 'application/json',
-      'Accept-Encoding': 'gzip, deflate',
-      'Content-Type': 'application/json',
-    },
-    body: JSON.stringify(messages),
-  })
-  if (!res.ok) {
-    const text = await res.text().catch(() => '')
-    console.error(`[push] Expo API error: ${res.status} ${text}`)
+  for (let i = 0; i < messages.length; i += EXPO_PUSH_BATCH_SIZE) {
+    const batch = messages.slice(i, i + EXPO_PUSH_BATCH_SIZE)
+    const res = await fetch('https://exp.host/--/api/v2/push/send', {
+      method: 'POST',
+      headers: {
+        Accept: 'application/json',
+        'Accept-Encoding': 'gzip, deflate',
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(batch),
+    })
+    if (!res.ok) {
+      const text = await res.text().catch(() => '')
+      console.error(`[push] Expo API error: ${res.status} ${text}`)
+    }
   }
 }
 
+// Load token entries with batched MGETs instead of one KV round trip per key
+async function loadPushTokenEntries(keys: string[]): Promise<PushTokenEntry[]> {
+  const entries: PushTokenEntry[] = []
+  for (let i = 0; i < keys.length; i += KV_MGET_BATCH_SIZE) {
+    const raws = await kv.mget<(string | PushTokenEntry | null)[]>(
+      ...keys.slice(i, i + KV_MGET_BATCH_SIZE)
+    )
+    for (const raw of raws) {
+      if (!raw) continue
+
+      const entry: PushTokenEntry =
+        typeof raw === 'string' ? (JSON.parse(raw) as PushTokenEntry) : raw
+
+      if (!entry.expo_push_token) continue
+      entries.push(entry)
+    }
+  }
+  return entries
+}
+
 export default async function handler(req: VercelRequest, res: VercelResponse) {
   // Verify cron secret to prevent unauthorized invocations
   const cronSecret = process.env.CRON_SECRET
@@ -96,18 +125,17 @@ export default async function handler(req: VercelRequest, res: VercelResponse) {
     return res.status(200).json({ ok: true, sent: 0, message: 'No registered tokens' })
   }
 
-  // Load all token entries and build per-user push messages
-  // Scores are fetched once per unique index_type via the scoreCache
-  const messages: ExpoPushMessage[] = []
-  for (const key of keys) {
-    const raw = await kv.get<string>(key)
-    if (!raw) continue
-
-    const entry: PushTokenEntry =
-      typeof raw === 'string' ? (JSON.parse(raw) as PushTokenEntry) : (raw as PushTokenEntry)
+  const entries = await loadPushTokenEntries(keys)
 
-    if (!entry.expo_push_token) continue
+  // Build per-user push messages
+  // Scores are fetched once per unique index_type via the per-run score lookup;
+  // all distinct index_types are requested concurrently up front
+  const getScore = createScoreLookup()
+  const indexTypes = new Set(entries.map((entry) => entry.index_type ?? 'SP500'))
+  await Promise.all([...indexTypes].map(getScore))
 
+  const messages: ExpoPushMessage[] = []
+  for (const entry of entries) {
     const indexType = entry.index_type ?? 'SP500'
     const score = await getScore(indexType)
     if (score === null) continue
@@ -1,3 +1,4 @@
+import dayjs from 'dayjs'
 import type { BacktestRequest, BacktestResult } from './types/apis'
 import { apiFetch, buildUrl } from './apiClient'
 
@@ -27,7 +28,7 @@ export async function runBacktest(payload: BacktestRequest): Promise<BacktestRes
 export interface EventItem {
   name: string
   importance: number
-  date: string // ISO形式 "2025-01-29"
+  date: string // ISO形式 "2025-01-29"（fetchEvents で YYYY-MM-DD に揃えて返す）
   source?: 'manual' | 'heuristic' | string
   description?: string
   // 将来フィールド追加されても壊れないようにしておく
@@ -68,16 +69,26 @@ export async function fetchEvents(dateIso?: string): Promise<EventItem[]> {
       ? json
       : []
 
-  const normalized = rawEvents
-    .filter((ev: unknown): ev is Record<string, unknown> => !!ev && typeof ev === 'object')
-    .map((ev: Record<string, unknown>) => ({
+  // オブジェクトでない要素と日付を持たない要素は除外する
+  const fallbackDate = String(json?.target ?? '')
+  const normalized: EventItem[] = []
+  for (const raw of rawEvents as unknown[]) {
+    if (!raw || typeof raw !== 'object') continue
+    const ev = raw as Record<string, unknown>
+    const rawDate = typeof ev.date === 'string' ? ev.date : fallbackDate
+    if (rawDate.length === 0) continue
+    // 画面側は YYYY-MM-DD の文字列として比較・切り出すため、ここで一度だけ揃える
+    const parsed = dayjs(rawDate)
+    if (!parsed.isValid()) continue
+    const date = parsed.format('YYYY-MM-DD')
+    normalized.push({
       name: typeof ev.name === 'string' ? ev.name : 'Unknown Event',
       importance: typeof ev.importance === 'number' ? ev.importance : 3,
-      date: typeof ev.date === 'string' ? ev.date : String(json?.target ?? ''),
+      date,
       source: typeof ev.source === 'string' ? ev.source : 'manual',
       description: typeof ev.description === 'string' ? ev.description : undefined,
-    }))
-    .filter((ev: EventItem) => ev.date.length > 0)
+    })
+  }
 
   return normalized
 }
@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react'
+import { useEffect, useMemo, useState } from 'react'
 import {
   Card,
   CardContent,
@@ -90,10 +90,15 @@ export function BacktestPage() {
     }
   }
 
-  const chartData = (result?.portfolio_history || []).map((p, idx) => ({
-    ...p,
-    buyHold: result?.buy_hold_history?.[idx]?.value ?? null,
-  }))
+  // 履歴は数千点になり得るため、結果が変わったときだけ組み立てる（入力中の再描画では作り直さない）
+  const chartData = useMemo(
+    () =>
+      (result?.portfolio_history || []).map((p, idx) => ({
+        ...p,
+        buyHold: result?.buy_hold_history?.[idx]?.value ?? null,
+      })),
+    [result],
+  )
 
   return (
     <Container maxWidth="lg" sx={{ py: 4 }}>
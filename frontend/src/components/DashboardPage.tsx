@@ -65,6 +65,21 @@ const defaultRequest: EvaluateRequest = {
 
 const REFRESH_INTERVAL_MS = 5 * 60 * 1000
 
+const PRICE_HISTORY_SLUGS: Record<IndexType, string> = {
+  SP500: 'sp500',
+  sp500_jpy: 'sp500-jpy',
+  TOPIX: 'topix',
+  NIKKEI: 'nikkei',
+  NIFTY50: 'nifty50',
+  ORUKAN: 'orukan',
+  orukan_jpy: 'orukan-jpy',
+}
+
+// 指数ごとの価格履歴 URL はモジュール読み込み時に一度だけ組み立てる
+const PRICE_HISTORY_URLS = Object.fromEntries(
+  Object.entries(PRICE_HISTORY_SLUGS).map(([key, slug]) => [key, buildUrl(`/api/${slug}/price-history`)]),
+) as Record<IndexType, string>
+
 type DisplayMode = 'pro' | 'simple'
 type StartOption = '1m' | '3m' | '6m' | '1y' | '3y' | '5y' | 'max' | 'custom'
 type PriceDisplayMode = 'normalized' | 'actual'
@@ -295,6 +310,40 @@ const getActiveBreakdown = (
   }
 }
 
+// 時間軸ごとの表示キー・文言は固定のため、レンダーごとに作らずモジュールで持つ
+const viewLabelMap: Record<ScoreMaDays, string> = {
+  20: '短期目線',
+  60: '中期目線',
+  200: '長期目線',
+}
+const viewDescriptionMap: Record<ScoreMaDays, string[]> = {
+  20: [
+    '短期目線では、直近の値動きや過熱感、イベントの影響を重視します。',
+    '「今すぐ動くべきか」「一時的な調整が入りそうか」といった直近のリスクを確認する視点です。',
+    '短期的なノイズも多いため、ここでの判断はタイミング調整の意味合いが強くなります。',
+  ],
+  60: [
+    '中期目線では、トレンドの持続性や環境の変化を重視します。',
+    '短期のブレをならしながら、「流れとしてどうか？」を判断する視点です。',
+    'この視点は、売り・保有・様子見の判断の中心になります。',
+  ],
+  200: [
+    '長期目線では、過去の平均水準や構造的な割高・割安感を重視します。',
+    '「今は歴史的に見てどの位置か？」という俯瞰の視点です。',
+    'ここでの判断は、天井圏か、まだ余地があるかを確認する意味合いになります。',
+  ],
+}
+const viewKeyMap: Record<ScoreMaDays, ViewKey> = {
+  20: 'short',
+  60: 'mid',
+  200: 'long',
+}
+const breakdownTitleMap: Record<ViewKey, string> = {
+  short: '短期目線の内訳',
+  mid: '中期目線の内訳',
+  long: '長期目線の内訳',
+}
+
 function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
   const [responses, setResponses] = useState<Partial<Record<IndexType, EvaluateResponse>>>({})
   const [error, setError] = useState<string | null>(null)
@@ -314,9 +363,11 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
   const [evalStatusMap, setEvalStatusMap] = useState<Partial<Record<IndexType, EvalStatus>>>({})
   const [evalReasonsMap, setEvalReasonsMap] = useState<Partial<Record<IndexType, string[]>>>({})
   const [evalStatusMessageMap, setEvalStatusMessageMap] = useState<Partial<Record<IndexType, string>>>({})
-  const priceReqSeqRef = useRef(0)
-  const evalReqSeqRef = useRef(0)
+  const priceReqSeqRef = useRef<Partial<Record<IndexType, number>>>({})
+  const evalReqSeqRef = useRef<Partial<Record<IndexType, number>>>({})
   const evalRetryTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null)
+  // 連番は指数ごとなので、画面全体の状態を更新してよいのは現在のプライマリ指数の結果だけにする
+  const primaryIndexRef = useRef<IndexType>(indexType)
   const latestEvalRequestIdRef = useRef<Partial<Record<IndexType, string>>>({})
 
   // ★ 追加：イベント用 state
@@ -410,6 +461,7 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
       clearTimeout(evalRetryTimeoutRef.current)
     }
     evalRetryTimeoutRef.current = setTimeout(() => {
+      if (markPrimary && primaryIndexRef.current !== targetIndex) return
       fetchEvaluation(targetIndex, payload, markPrimary, retryCount + 1)
     }, EVAL_RETRY_DELAYS_MS[retryCount])
   }
@@ -420,7 +472,8 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
     markPrimary = false,
     retryCount = 0,
   ) => {
-    const reqSeq = ++evalReqSeqRef.current
+    const reqSeq = (evalReqSeqRef.current[targetIndex] ?? 0) + 1
+    evalReqSeqRef.current[targetIndex] = reqSeq
     const clientRequestId = genRequestId()
     latestEvalRequestIdRef.current[targetIndex] = clientRequestId
     try {
@@ -436,7 +489,8 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
         }
       }
       const res = await apiClient.post<EvaluateResponse>(buildUrl('/api/evaluate'), body)
-      if (reqSeq !== evalReqSeqRef.current) return
+      if (reqSeq !== evalReqSeqRef.current[targetIndex]) return
+      if (markPrimary && primaryIndexRef.current !== targetIndex) return
       if (res.data.request_id !== latestEvalRequestIdRef.current[targetIndex]) return
       const latestSeries = priceSeriesMap[targetIndex] ?? []
       const normalized = normalizeEvaluateResponse(res.data, latestSeries)
@@ -496,7 +550,8 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
         setEvalReasonsMap((prev) => ({ ...prev, [targetIndex]: reasons }))
       }
     } catch (e: any) {
-      if (reqSeq !== evalReqSeqRef.current) return
+      if (reqSeq !== evalReqSeqRef.current[targetIndex]) return
+      if (markPrimary && primaryIndexRef.current !== targetIndex) return
       const status = e?.response?.status
       if (markPrimary) {
         setIsEvalRetrying(false)
@@ -519,39 +574,27 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
     }
   }
 
-  const getPriceHistoryEndpoint = (targetIndex: IndexType) => {
-    const map: Record<IndexType, string> = {
-      SP500: buildUrl('/api/sp500/price-history'),
-      sp500_jpy: buildUrl('/api/sp500-jpy/price-history'),
-      TOPIX: buildUrl('/api/topix/price-history'),
-      NIKKEI: buildUrl('/api/nikkei/price-history'),
-      NIFTY50: buildUrl('/api/nifty50/price-history'),
-      ORUKAN: buildUrl('/api/orukan/price-history'),
-      orukan_jpy: buildUrl('/api/orukan-jpy/price-history'),
-    }
-    return map[targetIndex]
-  }
-
   const fetchPriceSeries = async (targetIndex: IndexType) => {
-    const reqSeq = ++priceReqSeqRef.current
+    const reqSeq = (priceReqSeqRef.current[targetIndex] ?? 0) + 1
+    priceReqSeqRef.current[targetIndex] = reqSeq
     try {
-      const res = await apiClient.get<PricePoint[]>(getPriceHistoryEndpoint(targetIndex))
-      if (reqSeq !== priceReqSeqRef.current) return
-      const sorted = [...res.data]
+      const res = await apiClient.get<PricePoint[]>(PRICE_HISTORY_URLS[targetIndex])
+      if (reqSeq !== priceReqSeqRef.current[targetIndex]) return
+      // filter の結果は新しい配列なので、その場で sort しても res.data は書き換わらない
+      const sorted = res.data
         .filter((p) => typeof p?.date === 'string' && typeof p?.close === 'number' && Number.isFinite(p?.close))
         .sort((a, b) => a.date.localeCompare(b.date))
-        .map((p, idx) => {
-          const row = {
-            ...p,
-            ma20: typeof p.ma20 === 'number' && Number.isFinite(p.ma20) ? p.ma20 : null,
-            ma60: typeof p.ma60 === 'number' && Number.isFinite(p.ma60) ? p.ma60 : null,
-            ma200: typeof p.ma200 === 'number' && Number.isFinite(p.ma200) ? p.ma200 : null,
-          }
-          if (idx === 0 || idx === res.data.length - 1) {
-            console.debug('[PRICE ROW]', { index: targetIndex, row })
-          }
-          return row
-        })
+        .map((p) => ({
+          ...p,
+          ma20: typeof p.ma20 === 'number' && Number.isFinite(p.ma20) ? p.ma20 : null,
+          ma60: typeof p.ma60 === 'number' && Number.isFinite(p.ma60) ? p.ma60 : null,
+          ma200: typeof p.ma200 === 'number' && Number.isFinite(p.ma200) ? p.ma200 : null,
+        }))
+      // 先頭・末尾の行の確認ログは開発ビルドでのみ出力する
+      if (import.meta.env.DEV && sorted.length) {
+        console.debug('[PRICE ROW]', { index: targetIndex, row: sorted[0] })
+        console.debug('[PRICE ROW]', { index: targetIndex, row: sorted[sorted.length - 1] })
+      }
       setPriceSeriesMap((prev) => ({ ...prev, [targetIndex]: sorted }))
     } catch (e: any) {
       console.error('価格履歴取得に失敗しました', e)
@@ -588,15 +631,16 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
     })()
 
     const primary = indexType
+    primaryIndexRef.current = primary
     const secondaryTargets = targets.filter((target) => target !== primary)
 
-    await fetchPriceSeries(primary)
-    await fetchEvaluation(primary, undefined, true)
-
-    await Promise.all(
-      secondaryTargets.flatMap((target) => [fetchEvaluation(target), fetchPriceSeries(target)]),
-    )
-    await fetchNavs()
+    // 各リクエストは互いに依存しないため並列に投げ、待ち時間を最も遅い1本に揃える
+    await Promise.all([
+      fetchPriceSeries(primary),
+      fetchEvaluation(primary, undefined, true),
+      ...secondaryTargets.flatMap((target) => [fetchEvaluation(target), fetchPriceSeries(target)]),
+      fetchNavs(),
+    ])
   }
 
   useEffect(() => {
@@ -688,42 +732,10 @@ function DashboardPage({ displayMode }: { displayMode: DisplayMode }) {
     run()
   }, [indexType, priceSeries])
 
-  const viewLabelMap: Record<ScoreMaDays, string> = {
-    20: '短期目線',
-    60: '中期目線',
-    200: '長期目線',
-  }
-  const viewDescriptionMap: Record<ScoreMaDays, string[]> = {
-    20: [
-      '短期目線では、直近の値動きや過熱感、イベントの影響を重視します。',
-      '「今すぐ動くべきか」「一時的な調整が入りそうか」といった直近のリスクを確認する視点です。',
-      '短期的なノイズも多いため、ここでの判断はタイミング調整の意味合いが強くなります。',
-    ],
-    60: [
-      '中期目線では、トレンドの持続性や環境の変化を重視します。',
-      '短期のブレをならしながら、「流れとしてどうか？」を判断する視点です。',
-      'この視点は、売り・保有・様子見の判断の中心になります。',
-    ],
-    200: [
-      '長期目線では、過去の平均水準や構造的な割高・割安感を重視します。',
-      '「今は歴史的に見てどの位置か？」という俯瞰の視点です。',
-      'ここでの判断は、天井圏か、まだ余地があるかを確認する意味合いになります。',
-    ],
-  }
   const viewLabel = viewLabelMap[viewDays]
   const viewDescriptionLines = viewDescriptionMap[viewDays]
-  const viewKeyMap: Record<ScoreMaDays, 'short' | 'mid' | 'long'> = {
-    20: 'short',
-    60: 'mid',
-    200: 'long',
-  }
   const viewKey = viewKeyMap[viewDays]
   const activeBreakdown = useMemo(() => getActiveBreakdown(viewKey, displayResponse), [viewKey, displayResponse])
-  const breakdownTitleMap: Record<ViewKey, string> = {
-    short: '短期目線の内訳',
-    mid: '中期目線の内訳',
-    long: '長期目線の内訳',
-  }
   const breakdownFallbackNote = activeBreakdown?.isFallback
     ? '※内訳の時間軸別データが未提供のため、内訳は統合（総合）ベースで表示しています。'
     : undefined
@@ -1310,10 +1322,17 @@ function buildChartState({
 
 function filterSeriesFromStart(series: PricePoint[], startDate: dayjs.Dayjs | null): PricePoint[] {
   if (!series.length || !startDate) return series
-  return series.filter((p) => {
-    const current = dayjs(p.date)
-    return current.isAfter(startDate) || current.isSame(startDate, 'day')
-  })
+  // date は YYYY-MM-DD 形式なので、文字列比較がそのまま日付の比較になる
+  const startIso = startDate.format('YYYY-MM-DD')
+  // series は fetchPriceSeries で日付昇順に整列済みなので、開始位置を二分探索して後ろを切り出す
+  let lo = 0
+  let hi = series.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (series[mid].date < startIso) lo = mid + 1
+    else hi = mid
+  }
+  return lo === 0 ? series : series.slice(lo)
 }
 
 function normalizePriceSeries(series: PricePoint[]): PricePoint[] {
@@ -1332,12 +1351,14 @@ function normalizePriceSeries(series: PricePoint[]): PricePoint[] {
 
 function buildDualSeries(primary: PricePoint[], secondary: PricePoint[]): ChartPoint[] {
   const secondaryMap = new Map(secondary.map((p) => [p.date, p.close]))
-  return primary
-    .filter((p) => secondaryMap.has(p.date))
-    .map((p) => ({
-      ...p,
-      closeUsd: roundToTwo(secondaryMap.get(p.date) ?? 0),
-    }))
+  // primary の日付のうち secondary にも終値があるものだけを残す
+  const series: ChartPoint[] = []
+  for (const p of primary) {
+    const closeUsd = secondaryMap.get(p.date)
+    if (closeUsd === undefined) continue
+    series.push({ ...p, closeUsd: roundToTwo(closeUsd) })
+  }
+  return series
 }
 
 function resolveStartDate(series: PricePoint[], startOption: StartOption, customStart: string) {
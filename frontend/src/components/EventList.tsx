@@ -35,6 +35,18 @@ type Props = {
 
 dayjs.locale('ja')
 
+// 同じ日付が再描画のたびに整形されるため、整形結果を日付文字列ごとに保持する
+const dateJpCache = new Map<string, string>()
+
+const formatDateJp = (d: string) => {
+  const cached = dateJpCache.get(d)
+  if (cached !== undefined) return cached
+  const t = dayjs(d)
+  const formatted = t.isValid() ? t.format('YYYY/MM/DD (ddd)') : d
+  dateJpCache.set(d, formatted)
+  return formatted
+}
+
 const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, tooltips }) => {
   const title = tooltips?.events?.title ?? '重要イベント'
 
@@ -50,35 +62,33 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
     const heuristic = normalizedEvents.filter((e) => e.source !== 'manual')
 
     // 同じ name & date が manual にあるものは heuristic を捨てる
-    const isDuplicated = (h: EventItem) =>
-      manual.some((m) => m.name === h.name && m.date === h.date)
+    const manualKeys = new Set(manual.map((m) => `${m.name}|${m.date}`))
 
-    const cleanedHeuristic = heuristic.filter((h) => !isDuplicated(h))
+    const cleanedHeuristic = heuristic.filter((h) => !manualKeys.has(`${h.name}|${h.date}`))
 
     const merged = [...manual, ...cleanedHeuristic]
 
     // 日付昇順、同じ日なら importance 降順、最後に manual を優先
+    // date は YYYY-MM-DD 形式なので、文字列比較がそのまま日付順になる
     return merged.sort((a, b) => {
-      const da = dayjs(a.date)
-      const db = dayjs(b.date)
-      if (da.isBefore(db)) return -1
-      if (da.isAfter(db)) return 1
+      if (a.date < b.date) return -1
+      if (a.date > b.date) return 1
       if (a.importance !== b.importance) return b.importance - a.importance
       if (a.source === b.source) return 0
       return a.source === 'manual' ? -1 : 1
     })
   }, [events])
 
-  const today = dayjs().startOf('day')
+  // 「今日」は毎レンダー文字列で求め、memo / effect の依存には文字列を使う
+  // （dayjs オブジェクトは毎回別物になり依存が常に変わってしまうため）
+  const todayIso = dayjs().format('YYYY-MM-DD')
 
   // 直近イベントの index（今日か未来で一番近いもの）
+  // mergedEvents は YYYY-MM-DD の昇順なので、今日の日付文字列と比較するだけでよい
   const firstUpcomingIndex = useMemo(() => {
     if (!mergedEvents.length) return -1
-    return mergedEvents.findIndex((e) => {
-      const d = dayjs(e.date)
-      return d.isSame(today, 'day') || d.isAfter(today, 'day')
-    })
-  }, [mergedEvents, today])
+    return mergedEvents.findIndex((e) => e.date >= todayIso)
+  }, [mergedEvents, todayIso])
 
   const nextEvent =
     firstUpcomingIndex >= 0 && firstUpcomingIndex < mergedEvents.length
@@ -86,15 +96,20 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
       : null
 
   const nextDiffDays =
-    nextEvent != null ? dayjs(nextEvent.date).startOf('day').diff(today, 'day') : null
+    nextEvent != null ? dayjs(nextEvent.date).diff(dayjs(todayIso), 'day') : null
 
   // 「どのイベントが next か」をキーで判定
   const nextEventKey =
     nextEvent != null ? `${nextEvent.name}|${nextEvent.date}|${nextEvent.source}` : null
 
-  // これから/過去 で分割
-  const upcomingEvents = mergedEvents.filter((e) => !dayjs(e.date).isBefore(today, 'day'))
-  const pastEvents = mergedEvents.filter((e) => dayjs(e.date).isBefore(today, 'day'))
+  // これから/過去 で分割（昇順なので firstUpcomingIndex を境に一度で切り分ける）
+  const { upcomingEvents, pastEvents } = useMemo(() => {
+    if (firstUpcomingIndex < 0) return { upcomingEvents: [], pastEvents: mergedEvents }
+    return {
+      upcomingEvents: mergedEvents.slice(firstUpcomingIndex),
+      pastEvents: mergedEvents.slice(0, firstUpcomingIndex),
+    }
+  }, [mergedEvents, firstUpcomingIndex])
 
   // アコーディオンの開閉
   const [showUpcoming, setShowUpcoming] = useState(true)
@@ -102,12 +117,6 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
 
   const eventAdjust = eventDetails?.E_adj ?? null
 
-  const formatDateJp = (d: string) => {
-    const t = dayjs(d)
-    if (!t.isValid()) return d
-    return t.format('YYYY/MM/DD (ddd)')
-  }
-
   const getImportanceChip = (imp?: number) => {
     const value = typeof imp === 'number' ? imp : 3
     if (value >= 5) {
@@ -137,7 +146,7 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
 
   const renderEventRow = (ev: EventItem) => {
     const key = `${ev.name}|${ev.date}|${ev.source}`
-    const isPast = dayjs(ev.date).isBefore(today, 'day')
+    const isPast = ev.date < todayIso
     const isNext = key === nextEventKey
     const sourceChip = getSourceChip(ev.source)
 
@@ -224,16 +233,13 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
     </Box>
   )
 
-  const ymKey = (dateStr: string) => {
-    const parsed = dayjs(dateStr)
-    if (!parsed.isValid()) return dateStr
-    return parsed.format('YYYY-MM')
-  }
+  // date は fetchEvents で YYYY-MM-DD に揃えてあるので、先頭 7 文字がそのまま年月キーになる
+  const ymKey = (dateStr: string) => dateStr.slice(0, 7)
 
+  // items は日付昇順の mergedEvents を切り出したものなので、ここで並べ替え直す必要はない
   const groupByMonth = (items: EventItem[]) => {
-    const sorted = [...items].sort((a, b) => dayjs(a.date).diff(dayjs(b.date)))
     const groups: { ym: string; items: EventItem[] }[] = []
-    for (const item of sorted) {
+    for (const item of items) {
       const key = ymKey(item.date)
       const last = groups[groups.length - 1]
       if (last && last.ym === key) {
@@ -251,7 +257,7 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
 
   useEffect(() => {
     if (upcomingGroups.length === 0) return
-    const currentYm = today.format('YYYY-MM')
+    const currentYm = todayIso.slice(0, 7)
     setOpenMonths((prev) => {
       const nextState = { ...prev }
       for (const group of upcomingGroups) {
@@ -261,7 +267,7 @@ const EventList: React.FC<Props> = ({ eventDetails, events, isLoading, error, to
       }
       return nextState
     })
-  }, [upcomingGroups, today])
+  }, [upcomingGroups, todayIso])
 
   const formatMonthHeader = (ym: string, count: number) => {
     const parsed = dayjs(`${ym}-01`)
@@ -105,7 +105,8 @@ export function DashboardScreen() {
   }, [injectEntitlementsToCurrentPage])
 
   useEffect(() => {
-    void syncRevenueCatState()
+    // 課金状態の確認が終わったら（失敗時も）WebView を表示する
+    void syncRevenueCatState().finally(() => setPurchaseChecked(true))
   }, [syncRevenueCatState])
 
   useEffect(() => {
@@ -199,7 +200,6 @@ export function DashboardScreen() {
         pullToRefreshEnabled
         startInLoadingState
         allowsBackForwardNavigationGestures={Platform.OS === 'ios'}
-        injectedJavaScriptBeforeContentLoaded={injectedBeforeLoad}
         onLoadStart={({ nativeEvent }) => {
           debugLog('load-start', nativeEvent.url)
           setHasError(false)